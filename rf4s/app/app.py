@@ -48,11 +48,11 @@ class App(ABC):
         self.cfg = config.setup_cfg()
 
         config_path = ROOT / "config.yaml"
-        if not config_path.exists():
+        try:
+            self.cfg.merge_from_file(config_path)
+        except FileNotFoundError:
             logger.critical("config.yaml not found at %s", config_path)
             safe_exit()
-
-        self.cfg.merge_from_file(ROOT / "config.yaml")
         self.window = Window()
 
     def _on_release(self, key: keyboard.KeyCode) -> None:
@@ -81,10 +81,7 @@ class Tackle:
         def wrapper(self, *args, **kwargs):
             if not self.available:
                 return
-            try:
-                func(self, *args)
-            except Exception as e:
-                raise e
+            return func(self, *args, **kwargs)
 
         return wrapper
 
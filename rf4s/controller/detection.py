@@ -45,6 +45,16 @@ class TagColor(Enum):
     PURPLE = "purple_tag"
 
 
+# Lower and upper HSV bounds of tag colors, built once instead of on every check
+TAG_HSV_RANGES = {
+    TagColor.GREEN: (np.array([30, 128, 128]), np.array([36, 255, 255])),
+    TagColor.YELLOW: (np.array([22, 128, 128]), np.array([28, 255, 255])),
+    TagColor.PINK: (np.array([142, 64, 128]), np.array([148, 255, 255])),
+    TagColor.BLUE: (np.array([101, 64, 128]), np.array([107, 255, 255])),
+    TagColor.PURPLE: (np.array([127, 64, 128]), np.array([133, 255, 255])),
+}
+
+
 COORD_OFFSETS = {
     "1600x900": {
         "friction_brake_very_high": (502, 872),  # Left point only
@@ -109,6 +119,7 @@ class Detection:
         image_dir (Path): Directory containing reference images for detection.
         coord_offsets (dict): Dictionary of coordinate offsets for different window sizes.
         bait_icon_reference_img (Image): Reference image for bait icon detection.
+        tag_reference_imgs (dict): Reference images for tag detection, keyed by color.
     """
 
     def __init__(self, cfg, window: Window):
@@ -134,6 +145,7 @@ class Detection:
             )
 
         self.bait_icon_reference_img = Image.open(self.image_dir / "bait_icon.png")
+        self.tag_reference_imgs = {}  # Loaded on first use
 
     def _get_image_box(
         self, image: str, confidence: float, multiple: bool = False
@@ -154,18 +166,40 @@ class Detection:
             return pag.locateAllOnScreen(image_path, confidence=confidence)
         return pag.locateOnScreen(image_path, confidence=confidence)
 
+    def _get_any_image_box(
+        self, images: tuple[str, ...], confidence: float
+    ) -> Box | None:
+        """Locate the first matching image among several using a single screenshot.
+
+        :param images: Base names of the images, in order of priority.
+        :type images: tuple[str, ...]
+        :param confidence: Matching confidence for locate.
+        :type confidence: float
+        :return: Image box of the first match, None if none of them is found.
+        :rtype: Box | None
+        """
+        haystack_img = pag.screenshot()
+        for image in images:
+            image_path = str(self.image_dir / f"{image}.png")
+            box = pag.locate(image_path, haystack_img, confidence=confidence)
+            if box is not None:
+                return box
+        return None
+
     def _set_absolute_coords(self) -> None:
         """Add offsets to the base coordinates to get absolute ones."""
-        self.coord_offsets = COORD_OFFSETS[self.window.get_resolution_str()]
+        # The window must stay in place while running, query its box only once
+        box = self.window.get_box()
+        self.coord_offsets = COORD_OFFSETS[self.window.get_resolution_str(box)]
 
         for key in self.coord_offsets:
-            setattr(self, f"{key}_coord", self._get_absolute_coord(key))
+            setattr(self, f"{key}_coord", self._get_absolute_coord(key, box))
 
-        self.bait_icon_coord = self._get_absolute_coord("bait_icon") + [44, 52]
+        self.bait_icon_coord = self._get_absolute_coord("bait_icon", box) + [44, 52]
         friction_brake_key = f"friction_brake_{self.cfg.FRICTION_BRAKE.SENSITIVITY}"
-        self.friction_brake_coord = self._get_absolute_coord(friction_brake_key)
+        self.friction_brake_coord = self._get_absolute_coord(friction_brake_key, box)
 
-        bases = self._get_absolute_coord("float_camera")
+        bases = self._get_absolute_coord("float_camera", box)
         if self.cfg.SELECTED.MODE in ("telescopic", "bolognese"):
             match self.cfg.SELECTED.CAMERA_SHAPE:
                 case "tall":
@@ -180,41 +214,41 @@ class Detection:
                     raise ValueError(self.cfg.SELECTED.CAMERA_SHAPE)
             self.float_camera_rect = (*bases, width, height)  # (left, top, w, h)
 
-    def _get_absolute_coord(self, offset_key: str) -> list[int]:
+    def _get_absolute_coord(
+        self, offset_key: str, box: tuple[int, int, int, int]
+    ) -> list[int]:
         """Calculate absolute coordinate based on given key.
 
         :param offset_key: A key in the offset dictionary.
         :type offset_key: str
+        :param box: Game window box (x, y, width, height).
+        :type box: tuple[int, int, int, int]
         :return: Converted absolute coordinate.
         :rtype: list[int]
         """
-        box = self.window.get_box()
         return [box[i] + self.coord_offsets[offset_key][i] for i in range(2)]
 
     # ----------------------------- Untagged release ----------------------------- #
-    def is_tag_exist(self, color: TagColor):
-        match color:
-            case TagColor.GREEN:
-                lower = np.array([30, 128, 128])
-                upper = np.array([36, 255, 255])
-            case TagColor.YELLOW:
-                lower = np.array([22, 128, 128])
-                upper = np.array([28, 255, 255])
-            case TagColor.PINK:
-                lower = np.array([142, 64, 128])
-                upper = np.array([148, 255, 255])
-            case TagColor.BLUE:
-                lower = np.array([101, 64, 128])
-                upper = np.array([107, 255, 255])
-            case TagColor.PURPLE:
-                lower = np.array([127, 64, 128])
-                upper = np.array([133, 255, 255])
-            case _:
-                raise ValueError("Invalid tag color")
-        hsv_img = cv2.cvtColor(np.array(pag.screenshot()), cv2.COLOR_RGB2HSV)
+    def get_hsv_screenshot(self) -> np.ndarray:
+        """Take a screenshot in HSV color space for tag detection.
+
+        :return: HSV image of the whole screen.
+        :rtype: np.ndarray
+        """
+        return cv2.cvtColor(np.array(pag.screenshot()), cv2.COLOR_RGB2HSV)
+
+    def is_tag_exist(self, color: TagColor, hsv_img: np.ndarray | None = None):
+        if color not in TAG_HSV_RANGES:
+            raise ValueError("Invalid tag color")
+        lower, upper = TAG_HSV_RANGES[color]
+        if hsv_img is None:
+            hsv_img = self.get_hsv_screenshot()
         mask = cv2.inRange(hsv_img, lower, upper)
         haystack_img = Image.fromarray(mask)
-        needle_img = Image.open(self.image_dir / f"{color.value}.png")
+        needle_img = self.tag_reference_imgs.get(color)
+        if needle_img is None:
+            needle_img = Image.open(self.image_dir / f"{color.value}.png")
+            self.tag_reference_imgs[color] = needle_img
         return pag.locate(needle_img, haystack_img, grayscale=True, confidence=0.9)
 
     def is_fish_species_matched(self, species: str):
@@ -277,9 +311,7 @@ class Detection:
         return ready or self._is_spool_full()
 
     def _is_rainbow_line_0or5m(self):
-        return self._get_image_box(
-            "5m", self.cfg.SCRIPT.SPOOL_CONFIDENCE
-        ) or self._get_image_box("0m", self.cfg.SCRIPT.SPOOL_CONFIDENCE)
+        return self._get_any_image_box(("5m", "0m"), self.cfg.SCRIPT.SPOOL_CONFIDENCE)
 
     def _is_spool_full(self):
         return self._get_image_box("wheel", self.cfg.SCRIPT.SPOOL_CONFIDENCE)
@@ -320,9 +352,7 @@ class Detection:
         return self._get_image_box("warning", 0.8)
 
     def is_operation_success(self):
-        return self._get_image_box("ok_black", 0.8) or self._get_image_box(
-            "ok_white", 0.8
-        )
+        return self._get_any_image_box(("ok_black", "ok_white"), 0.8)
 
     def is_material_complete(self):
         return not self._get_image_box("material_slot", 0.7)
@@ -7,7 +7,6 @@ from email.mime.text import MIMEText
 from enum import Enum
 from urllib import parse, request
 
-from discord_webhook import DiscordEmbed, DiscordWebhook
 from rich import box
 from rich.console import Console
 from rich.table import Table
@@ -55,6 +54,9 @@ class DiscordNotification:
         return capture.get().strip()
 
     def send(self, color: DiscordColor):
+        # Only needed when -D is used, don't pay for requests on every launch
+        from discord_webhook import DiscordEmbed, DiscordWebhook
+
         logger.info("Sending Discord notification")
         raw_table = self.build_raw_table()
         webhook = DiscordWebhook(
@@ -95,9 +97,7 @@ class EmailNotification:
         recipients = [self.cfg.NOTIFICATION.EMAIL]
         msg["To"] = ", ".join(recipients)
 
-        text = ""
-        for k, v in self.result.items():
-            text += f"{k}: {v}\n"
+        text = "".join(f"{k}: {v}\n" for k, v in self.result.items())
         msg.attach(MIMEText(text))
 
         try:
@@ -127,9 +127,7 @@ class MiaotixingNotification:
         """
         logger.info("Sending miaotixing notification")
 
-        text = ""
-        for k, v in self.result.items():
-            text += f"{k}: {v}\n"
+        text = "".join(f"{k}: {v}\n" for k, v in self.result.items())
 
         url = "http://miaotixing.com/trigger?" + parse.urlencode(
             {"id": self.cfg.NOTIFICATION.MIAO_CODE, "text": text, "type": "json"}
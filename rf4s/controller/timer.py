@@ -12,9 +12,6 @@ import sys
 import time
 from pathlib import Path
 
-from matplotlib import pyplot as plt
-from matplotlib.ticker import MaxNLocator
-
 from rf4s.utils import is_compiled
 
 logger = logging.getLogger("rich")
@@ -112,9 +109,12 @@ class Timer:
 
     def update_cast_time(self) -> None:
         """Update the latest real and in-game hour of casting."""
-        dt = datetime.datetime.now()
-        self.cast_rhour = int((time.time() - self.start_time) // 3600)
-        self.cast_ghour = int((dt.minute / 60 + dt.second / 3600) * 24 % 24)
+        cur_time = time.time()
+        cur_localtime = time.localtime(cur_time)  # Reuse the same clock reading
+        self.cast_rhour = int((cur_time - self.start_time) // 3600)
+        self.cast_ghour = int(
+            (cur_localtime.tm_min / 60 + cur_localtime.tm_sec / 3600) * 24 % 24
+        )
 
     def add_cast_time(self) -> None:
         """Record the latest real and in-game hour of casting."""
@@ -197,6 +197,10 @@ class Timer:
             logger.warning("No cast record, skip plotting")
             return
 
+        # matplotlib is slow to import and only needed with -d, import it on demand
+        from matplotlib import pyplot as plt
+        from matplotlib.ticker import MaxNLocator
+
         logger.info("Plotting line chart")
 
         _, ax = plt.subplots(nrows=1, ncols=2)
@@ -9,6 +9,7 @@ and terminal window in Russian Fishing 4.
 import logging
 import sys
 from pathlib import Path
+from threading import Thread
 from time import sleep
 
 # import win32api, win32con
@@ -29,6 +30,20 @@ else:
     ROOT = Path(__file__).resolve().parents[2]
 
 
+def _save_image(image, path: Path) -> None:
+    """Save an image and log the error instead of raising it in the thread.
+
+    :param image: Image to save.
+    :type image: PIL.Image.Image
+    :param path: Destination file path.
+    :type path: Path
+    """
+    try:
+        image.save(path)
+    except OSError as e:
+        logger.error("Failed to save screenshot to %s: %s", path, e)
+
+
 class Window:
     """Controller for terminal and game windows management.
 
@@ -38,6 +53,7 @@ class Window:
     Attributes:
         game_title (str): Title of the game window.
         terminal_hwnd (int): Handle of the terminal window.
+        game_hwnd (int | None): Cached handle of the game window.
     """
 
     def __init__(self, game_title: str = "Russian Fishing 4"):
@@ -52,26 +68,38 @@ class Window:
         """
         self.game_title = game_title
         self.terminal_hwnd = win32gui.GetForegroundWindow()
+        self.game_hwnd = None
 
     def _get_game_hwnd(self) -> int:
         """Get the handle of the game window.
 
+        The handle is cached and only looked up again if the window was closed
+        (e.g., the game was restarted).
+
         :return: Process handle of the game window.
         :rtype: int
         """
+        if self.game_hwnd is not None and win32gui.IsWindow(self.game_hwnd):
+            return self.game_hwnd
+
         hwnd = win32gui.FindWindow(None, self.game_title)  # class name: UnityWndClass
         if hwnd == 0:
             logger.critical("Failed to locate the game window: %s", self.game_title)
             utils.safe_exit()
+        self.game_hwnd = hwnd
         return hwnd
 
-    def is_title_bar_exist(self) -> bool:
+    def is_title_bar_exist(self, hwnd: int | None = None) -> bool:
         """Check if the game window is in windowed mode.
 
+        :param hwnd: Handle of the game window, looked up if not given.
+        :type hwnd: int | None, optional
         :return: True if the game window has a title bar, False otherwise.
         :rtype: bool
         """
-        style = win32gui.GetWindowLong(self._get_game_hwnd(), win32con.GWL_STYLE)
+        if hwnd is None:
+            hwnd = self._get_game_hwnd()
+        style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
         return style & win32con.WS_CAPTION
 
     def get_box(self) -> tuple[int, int, int, int]:
@@ -80,13 +108,15 @@ class Window:
         :return: Tuple containing (x, y, width, height) of the game window.
         :rtype: tuple[int, int, int, int]
         """
+        # Look up the handle once and reuse it for all three queries
+        hwnd = self._get_game_hwnd()
         # Absolute coordinates
-        base_x, base_y, _, _ = win32gui.GetWindowRect(self._get_game_hwnd())
-        if self.is_title_bar_exist():
+        base_x, base_y, _, _ = win32gui.GetWindowRect(hwnd)
+        if self.is_title_bar_exist(hwnd):
             base_x += 8
             base_y += 31
         # Relative coordinates
-        left, top, right, bottom = win32gui.GetClientRect(self._get_game_hwnd())
+        left, top, right, bottom = win32gui.GetClientRect(hwnd)
         return base_x, base_y, right - left, bottom - top
 
     def get_base_coordinates(self) -> tuple[int, int]:
@@ -97,13 +127,17 @@ class Window:
         """
         return self.get_box()[:2]
 
-    def get_resolution_str(self) -> tuple[int, int]:
+    def get_resolution_str(self, box: tuple[int, int, int, int] | None = None) -> str:
         """Get the resolution of the game window.
 
-        :return: Tuple containing (width, height) of the game window.
-        :rtype: tuple[int, int]
+        :param box: Box of the game window, queried if not given.
+        :type box: tuple[int, int, int, int] | None, optional
+        :return: Resolution of the game window in "{width}x{height}" format.
+        :rtype: str
         """
-        width, height = self.get_box()[2:]
+        if box is None:
+            box = self.get_box()
+        width, height = box[2:]
         return f"{width}x{height}"
 
     def activate_script_window(self) -> None:
@@ -136,10 +170,12 @@ class Window:
         :param time: Timestamp for the filename.
         :type time: str
         """
-        pag.screenshot(
-            imageFilename=ROOT / "screenshots" / f"{time}.png",
-            region=self.get_box(),
-        )
+        image = pag.screenshot(region=self.get_box())
+        # PNG encoding and writing is slow, don't block the caller with it.
+        # Non-daemon thread, so the file is still completed if the script exits.
+        Thread(
+            target=_save_image, args=(image, ROOT / "screenshots" / f"{time}.png")
+        ).start()
 
 
 if __name__ == "__main__":
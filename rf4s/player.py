@@ -425,8 +425,7 @@ class Player:
         except exceptions.TicketExpiredError:
             self._handle_expired_ticket()
             raise TimeoutError  # Transform into TimeoutError to continue
-        except TimeoutError:
-            raise
+        # TimeoutError is not handled here and propagates to the caller
 
     @contextmanager
     def clicklock_disable_handler(self):
@@ -805,22 +804,31 @@ class Player:
 
     def _handle_fish(self) -> None:
         """Keep or release the fish and record the fish count."""
-        tagged = False
-        for tag in self.cfg.SCRIPT.SCREENSHOT_TAGS:
-            if self.detection.is_tag_exist(TagColor[tag.upper()]):
-                tagged = True
-        tagged = not self.cfg.SCRIPT.SCREENSHOT_TAGS or tagged
-        if self.cfg.ARGS.SCREENSHOT and tagged:
-            self.window.save_screenshot(self.timer.get_cur_timestamp())
+        # The fish screen doesn't change until we press a key, take a single
+        # snapshot on first need and reuse it for every tag check below
+        hsv_img = None
+
+        # Tag detection is expensive, skip it if screenshots are disabled
+        if self.cfg.ARGS.SCREENSHOT:
+            hsv_img = self.detection.get_hsv_screenshot()
+            # Stop at the first matching tag, one is enough to take a screenshot
+            tagged = any(
+                self.detection.is_tag_exist(TagColor[tag.upper()], hsv_img)
+                for tag in self.cfg.SCRIPT.SCREENSHOT_TAGS
+            )
+            if not self.cfg.SCRIPT.SCREENSHOT_TAGS or tagged:
+                self.window.save_screenshot(self.timer.get_cur_timestamp())
 
         self.result.total += 1
         if self.detection.is_fish_blacklisted():
             pag.press("backspace")
             return
 
+        if hsv_img is None:
+            hsv_img = self.detection.get_hsv_screenshot()
         tagged = False
         for tag in TagColor:
-            if self.detection.is_tag_exist(tag):
+            if self.detection.is_tag_exist(tag, hsv_img):
                 tag_color = tag.name.lower()
                 setattr(self.result, tag_color, getattr(self.result, tag_color) + 1)
                 if tag_color in self.cfg.KEEPNET.TAGS:
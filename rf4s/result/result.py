@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from rf4s.controller.timer import Timer
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Dummy result."""
 
@@ -11,7 +11,7 @@ class Result:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class RF4SResult:
     tea: int = 0
     carrot: int = 0
@@ -53,7 +53,7 @@ class RF4SResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CraftResult:
     succes: int = 0
     fail: int = 0
@@ -67,7 +67,7 @@ class CraftResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HarvestResult:
     tea: int = 0
     carrot: int = 0
@@ -27,6 +27,7 @@ LOOP_DELAY = 1
 ANIMATION_DELAY = 1
 
 logger = logging.getLogger("rich")
+console = Console()
 
 # ---------------------------------------------------------------------------- #
 #                            common functionalities                            #
@@ -212,7 +213,7 @@ def release_keys_after(arrow_keys: bool = False):
 def print_error(msg):
     text = Text(msg)
     text.stylize("red")
-    Console().print(text)
+    console.print(text)
 
 
 # There's lots of early return in player._resetting_stage(),
@@ -7,6 +7,7 @@ argument parsing, window management, and fishing automation.
 .. moduleauthor:: Derek Lee <dereklee0310@gmail.com>
 """
 
+import os
 import shlex
 import smtplib
 import sys
@@ -22,12 +23,6 @@ from rich.table import Column, Table
 from yacs.config import CfgNode as CN
 
 sys.path.append(".")  # python -m module -> python file
-import auto_friction_brake
-import calculate
-import craft
-import harvest
-import move
-
 from rf4s import utils
 from rf4s.app.app import App
 from rf4s.config import config
@@ -294,14 +289,16 @@ class RF4SApp(App):
             self.cfg.SCRIPT.LANGUAGE,
         )
         image_dir = ROOT / "static" / self.cfg.SCRIPT.LANGUAGE
+        # scandir gets the file type from the directory listing, no stat per entry
         try:
-            current_images = [f.name for f in image_dir.iterdir() if f.is_file()]
+            with os.scandir(image_dir) as entries:
+                current_images = {e.name for e in entries if e.is_file()}
         except FileNotFoundError:
             logger.critical("Invalid language: '%s'", self.cfg.SCRIPT.LANGUAGE)
             return False
-        template_dir = ROOT / "static" / "en"
-        target_images = [f.name for f in template_dir.iterdir() if f.is_file()]
-        missing_images = set(target_images) - set(current_images)
+        with os.scandir(ROOT / "static" / "en") as entries:
+            target_images = {e.name for e in entries if e.is_file()}
+        missing_images = target_images - current_images
         if len(missing_images) > 0:
             logger.critical("Some images are missing, please add them manually")
             table = Table(
@@ -582,12 +579,22 @@ if __name__ == "__main__":
                 logger.critical(e, exc_info=True)
             utils.safe_exit()
         case 1:
+            import craft
+
             craft.run_app_from_main()
         case 2:
+            import harvest
+
             harvest.run_app_from_main()
         case 3:
+            import move
+
             move.run_app_from_main()
         case 4:
+            import auto_friction_brake
+
             auto_friction_brake.run_app_from_main()
         case 5:
+            import calculate
+
             calculate.run_app_from_main()